@@ -5,7 +5,7 @@ from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.utils import datetime_from_epoch
 
-from .models import Job, Tag
+from .models import AnalysisReport, Job, Tag
 from intel_owl.settings import CLIENT_TOKEN_LIFETIME_DAYS, SIMPLE_JWT as jwt_settings
 
 
@@ -23,6 +23,12 @@ class JobAdminView(admin.ModelAdmin):
     search_fields = ("source", "md5", "observable_name")
 
 
+class AnalysisReportAdminView(admin.ModelAdmin):
+    list_display = ("id", "job", "success")
+    list_select_related = ("job",)
+    list_filter = ("success",)
+
+
 class TagAdminView(admin.ModelAdmin):
     list_display = ("id", "label", "color")
     search_fields = ("label", "color")
@@ -110,6 +116,7 @@ class CustomOutstandingTokenAdmin(OutstandingTokenAdmin):
 
 admin.site.register(Job, JobAdminView)
 admin.site.register(Tag, TagAdminView)
+admin.site.register(AnalysisReport, AnalysisReportAdminView)
 # Unregister the default admin view for OutstandingToken
 admin.site.unregister(OutstandingToken)
 # Register our custom admin view for OutstandingToken
@@ -411,9 +411,7 @@ class JobViewSet(viewsets.ReadOnlyModelViewSet):
 
     def list(self, request):
         queryset = (
-            models.Job.objects.order_by("-received_request_time")
-            .defer("analysis_reports", "errors")
-            .all()
+            models.Job.objects.order_by("-received_request_time").defer("errors").all()
         )
         serializer = serializers.JobListSerializer(queryset, many=True)
         return Response(serializer.data)
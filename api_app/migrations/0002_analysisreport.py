@@ -0,0 +1,71 @@
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_reports_to_table(apps, schema_editor):
+    Job = apps.get_model("api_app", "Job")
+    AnalysisReport = apps.get_model("api_app", "AnalysisReport")
+    jobs = Job.objects.exclude(analysis_reports=None).only("analysis_reports")
+    for job in jobs.iterator():
+        AnalysisReport.objects.bulk_create(
+            AnalysisReport(
+                job_id=job.id,
+                payload=report,
+                success=bool(report.get("success", False)),
+            )
+            for report in job.analysis_reports or []
+        )
+
+
+def copy_reports_to_column(apps, schema_editor):
+    Job = apps.get_model("api_app", "Job")
+    AnalysisReport = apps.get_model("api_app", "AnalysisReport")
+    for job in Job.objects.only("id").iterator():
+        job.analysis_reports = list(
+            AnalysisReport.objects.filter(job_id=job.id)
+            .order_by("id")
+            .values_list("payload", flat=True)
+        )
+        job.save(update_fields=["analysis_reports"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalysisReport",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "payload",
+                    django.contrib.postgres.fields.jsonb.JSONField(default=dict),
+                ),
+                ("success", models.BooleanField(db_index=True, default=False)),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reports",
+                        to="api_app.Job",
+                    ),
+                ),
+            ],
+        ),
+        # the reports of the existing jobs are copied, the column is dropped in
+        # the next migration: postgres does not allow altering the table in the
+        # same transaction of the inserts, because of the deferred foreign keys
+        migrations.RunPython(copy_reports_to_table, copy_reports_to_column),
+    ]
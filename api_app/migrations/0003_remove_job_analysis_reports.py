@@ -0,0 +1,12 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api_app", "0002_analysisreport"),
+    ]
+
+    operations = [
+        migrations.RemoveField(model_name="job", name="analysis_reports"),
+    ]
@@ -38,7 +38,6 @@ class Job(models.Model):
     analyzers_to_execute = postgres_fields.ArrayField(
         models.CharField(max_length=900), blank=True, default=list
     )
-    analysis_reports = postgres_fields.JSONField(default=list, null=True, blank=True)
     received_request_time = models.DateTimeField(auto_now_add=True)
     finished_analysis_time = models.DateTimeField(blank=True, null=True)
     force_privacy = models.BooleanField(blank=False, default=False)
@@ -54,3 +53,17 @@ class Job(models.Model):
             return f'Job("{self.observable_name}")'
         else:
             return f'Job("{self.file_name}")'
+
+    @property
+    def analysis_reports(self):
+        # reports are stored in their own table, one row per analyzer
+        return list(self.reports.order_by("id").values_list("payload", flat=True))
+
+
+class AnalysisReport(models.Model):
+    job = models.ForeignKey(Job, related_name="reports", on_delete=models.CASCADE)
+    payload = postgres_fields.JSONField(default=dict)
+    success = models.BooleanField(blank=False, default=False, db_index=True)
+
+    def __str__(self):
+        return f'AnalysisReport(job={self.job_id}, name="{self.payload.get("name")}")'
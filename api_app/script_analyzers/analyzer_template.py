@@ -1,4 +1,3 @@
-import traceback
 import logging
 
 from api_app.exceptions import AnalyzerRunException
@@ -15,9 +14,8 @@ def run(
     observable_classification,
     additional_config_params,
 ):
-    logger.info(
-        f"started analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "KEY_NAME")
@@ -35,16 +33,11 @@ def run(
             f"job_id:{job_id} analyzer:{analyzer_name}"
             f" observable_name:{observable_name} Analyzer error {e}"
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            f"job_id:{job_id} analyzer:{analyzer_name}"
-            f" observable_name:{observable_name} Unexpected error {e}"
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -52,8 +45,6 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        "ended analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
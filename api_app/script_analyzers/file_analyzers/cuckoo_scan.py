@@ -1,6 +1,5 @@
 import re
 import time
-import traceback
 import requests
 import logging
 
@@ -22,7 +21,8 @@ class CuckooAnalysis:
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         # cuckoo installation can be with or without the api_token
@@ -32,10 +32,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             api_key = secrets.get_secret(api_key_name)
         else:
             api_key = None
-            logger.info(
-                "job_id {} md5 {} analyzer {} no API key set"
-                "".format(job_id, md5, analyzer_name)
-            )
+            log.info("md5:%s no API key set", md5)
 
         cuckoo_url = secrets.get_secret("CUCKOO_URL")
         if not cuckoo_url:
@@ -58,16 +55,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -75,7 +67,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
 
@@ -94,7 +86,7 @@ def _cuckoo_scan_file(cuckoo_analysis, additional_config_params, filename, md5,
 def _cuckoo_request_scan(
     cuckoo_analysis, additional_config_params, filename, md5, binary
 ):
-    logger.info("requesting scan for {} {}".format(filename, md5))
+    logger.info("requesting scan for %s %s", filename, md5)
 
     # send the file for analysis
     name_to_send = filename if filename else md5
@@ -103,16 +95,14 @@ def _cuckoo_request_scan(
     post_success = False
     response = None
     for chance in range(max_post_tries):
-        logger.info(
-            "request n.{} for file analysis of {} {}" "".format(chance, filename, md5)
-        )
+        logger.info("request n.%s for file analysis of %s %s", chance, filename, md5)
         response = cuckoo_analysis.session.post(
             cuckoo_analysis.cuckoo_url + "tasks/create/file", files=files
         )
         if response.status_code != 200:
             logger.info(
-                "failed post to start cuckoo analysis, status code {}"
-                "".format(response.status_code)
+                "failed post to start cuckoo analysis, status code %s",
+                response.status_code,
             )
             time.sleep(5)
             continue
@@ -135,9 +125,10 @@ def _cuckoo_request_scan(
 
 def _cuckoo_poll_result(cuckoo_analysis, filename, md5, additional_config_params):
     logger.info(
-        "polling result for {} {}, task_id {}".format(
-            filename, md5, cuckoo_analysis.task_id
-        )
+        "polling result for %s %s, task_id %s",
+        filename,
+        md5,
+        cuckoo_analysis.task_id,
     )
 
     # poll for the result
@@ -145,9 +136,7 @@ def _cuckoo_poll_result(cuckoo_analysis, filename, md5, additional_config_params
     poll_time = 15
     get_success = False
     for chance in range(max_get_tries):
-        logger.info(
-            "polling request n.{} for file {} {}" "".format(chance + 1, filename, md5)
-        )
+        logger.info("polling request n.%s for file %s %s", chance + 1, filename, md5)
         url = cuckoo_analysis.cuckoo_url + "tasks/view/" + str(cuckoo_analysis.task_id)
         response = cuckoo_analysis.session.get(url)
         json_response = response.json()
@@ -172,9 +161,10 @@ def _cuckoo_poll_result(cuckoo_analysis, filename, md5, additional_config_params
 
 def _cuckoo_retrieve_and_create_report(cuckoo_analysis, filename, md5):
     logger.info(
-        "generating report for {} {}, task_id {}".format(
-            filename, md5, cuckoo_analysis.task_id
-        )
+        "generating report for %s %s, task_id %s",
+        filename,
+        md5,
+        cuckoo_analysis.task_id,
     )
     # download the report
     response = cuckoo_analysis.session.get(
@@ -318,6 +308,6 @@ def _cuckoo_retrieve_and_create_report(cuckoo_analysis, filename, md5):
         },
     }
 
-    logger.info("report generated for {} {}".format(filename, md5))
+    logger.info("report generated for %s %s", filename, md5)
 
     cuckoo_analysis.report = result
@@ -1,4 +1,3 @@
-import traceback
 import logging
 
 from oletools import mraptor
@@ -11,7 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         results = {}
@@ -81,9 +81,8 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             vbaparser.close()
 
         except Exception as e:
-            traceback.print_exc()
             error_message = "job_id {} vba parser failed. Error: {}".format(job_id, e)
-            logger.exception(error_message)
+            log.exception("vba parser failed. Error: %s", e)
             report["errors"].append(error_message)
 
         results["olevba"] = olevba_results
@@ -101,16 +100,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -118,6 +112,6 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
@@ -1,6 +1,5 @@
 import hashlib
 import pydeep
-import traceback
 import magic
 import pyexifinfo
 import logging
@@ -12,7 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         results = {}
@@ -41,16 +41,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -58,6 +53,6 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
@@ -1,6 +1,5 @@
 import os
 import time
-import traceback
 import requests
 import logging
 
@@ -15,7 +14,8 @@ base_url = "https://analyze.intezer.com/api/v2-0"
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "")
@@ -45,16 +45,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -62,7 +57,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
 
@@ -84,7 +79,7 @@ def _intezer_scan_file(intezer_token, md5, filename, binary, additional_config_p
 
     name_to_send = filename if filename else md5
     files = {"file": (name_to_send, binary)}
-    logger.info("intezer md5 {} sending sample for analysis".format(md5))
+    logger.info("intezer md5 %s sending sample for analysis", md5)
     response = session.post(base_url + "/analyze", files=files)
     if response.status_code != 201:
         raise AnalyzerRunException(
@@ -96,9 +91,7 @@ def _intezer_scan_file(intezer_token, md5, filename, binary, additional_config_p
     for chance in range(max_tries):
         if response.status_code != 200:
             time.sleep(polling_time)
-            logger.info(
-                "intezer md5 {} polling for result try n.{}".format(md5, chance + 1)
-            )
+            logger.info("intezer md5 %s polling for result try n.%s", md5, chance + 1)
             result_url = response.json().get("result_url", "")
             response = session.get(base_url + result_url)
             response.raise_for_status()
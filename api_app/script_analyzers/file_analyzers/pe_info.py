@@ -1,4 +1,3 @@
-import traceback
 import logging
 import pefile
 
@@ -10,7 +9,8 @@ logger = logging.getLogger(__name__)
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         results = {}
@@ -85,8 +85,8 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
                 try:
                     export_table.append(symbol_name.decode())
                 except (UnicodeDecodeError, AttributeError) as e:
-                    logger.debug(
-                        f"PE info error while decoding export table symbols: {e}"
+                    log.debug(
+                        "PE info error while decoding export table symbols: %s", e
                     )
             results["export_table"] = export_table
 
@@ -98,16 +98,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} PEFormatError {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.warning(warning_message)
+        log.warning("md5:%s filename:%s PEFormatError %s", md5, filename, e)
         report["errors"].append(warning_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -117,6 +112,6 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     # pprint.pprint(report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
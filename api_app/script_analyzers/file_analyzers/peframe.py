@@ -1,17 +1,34 @@
 import requests
-import traceback
-import json
 import logging
-import time
+import orjson
+
+from celery.exceptions import Retry
 
 from api_app.exceptions import AnalyzerRunException
 from api_app.script_analyzers import general
+from intel_owl import tasks
 
 logger = logging.getLogger(__name__)
 
+# seconds between two polls for the result
+POLL_DISTANCE = 5
+
+# exceptions for the errors returned by the container, by status code
+_STATUS_HANDLERS = {
+    404: lambda r: AnalyzerRunException("PEframe docker container is not running."),
+    400: lambda r: AnalyzerRunException(r.json()["error"]),
+    500: lambda r: AnalyzerRunException(
+        "Internal Server Error in PEframe docker container"
+    ),
+}
+
+# shared by every request to the container so that the connection is kept alive
+_session = requests.Session()
+
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info(f"started analyzer {analyzer_name} job_id {job_id}")
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         # get binary
@@ -19,47 +36,88 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
         # request new analysis
         req_data = {"args": ["-j", "@filetoscan"]}
         req_files = {"filetoscan": binary}
-        r = requests.post("http://peframe:4000/peframe", files=req_files, data=req_data)
-        # handle cases in case of error
-        if r.status_code == 404:
-            raise AnalyzerRunException("PEframe docker container is not running.")
-        if r.status_code == 400:
-            err = r.json()["error"]
-            raise AnalyzerRunException(err)
-        if r.status_code == 500:
-            raise AnalyzerRunException(
-                "Internal Server Error in PEframe docker container"
-            )
-        # just in case error is something else
-        r.raise_for_status()
+        r = _session.post("http://peframe:4000/peframe", files=req_files, data=req_data)
+        _check_status_code(r)
 
         max_tries = additional_config_params.get("max_tries", 15)
         r_data = r.json()
-        resp = _poll_for_result(job_id, r_data["key"], max_tries)
+        # the polling task may run in another process, where this is meaningless
+        report.pop("started_monotonic", None)
+        poll_args = [analyzer_name, job_id, filename, md5, r_data["key"], report]
+        # do not keep the worker busy while the container is analyzing the file:
+        # the result is polled by a task which reschedules itself
+        tasks.peframe_poll.apply_async(
+            args=poll_args + [max_tries],
+            countdown=POLL_DISTANCE,
+        )
+    except AnalyzerRunException as e:
+        error_message = (
+            f"job_id:{job_id} analyzer:{analyzer_name}"
+            f" md5:{md5} filename:{filename} Analyzer Error: {e}"
+        )
+        log.error("md5:%s filename:%s Analyzer Error: %s", md5, filename, e)
+        report["errors"].append(error_message)
+        report["success"] = False
+    except Exception as e:
+        log.exception("md5:%s filename:%s. Unexpected Error: %s", md5, filename, e)
+        report["errors"].append(str(e))
+        report["success"] = False
+    else:
+        log.info("scheduled polling")
+        # the report is still incomplete: it is set by the polling task
+        return None
+
+    general.set_report_and_cleanup(job_id, report)
+
+    log.info("ended")
+
+    return report
+
+
+def poll(task, analyzer_name, job_id, filename, md5, key, report, max_tries):
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    try:
+        chance = task.request.retries
+        log.info("PEframe polling. Try n:%s. Starting the query", chance + 1)
+        try:
+            status_code, json_data = _query_for_result(key)
+        except requests.RequestException as e:
+            raise AnalyzerRunException(e)
+        analysis_status = json_data.get("status", None)
+        if analysis_status not in ["success", "reported_with_fails", "failed"]:
+            if status_code != 404:
+                log.info(
+                    "PEframe polling. Try n:%s, status:%s", chance + 1, analysis_status
+                )
+            if chance + 1 >= max_tries:
+                raise AnalyzerRunException(
+                    "max peframe polls tried without getting any result."
+                    f" job_id:{job_id}"
+                )
+            # free the worker until the next poll
+            raise task.retry(countdown=POLL_DISTANCE, max_retries=max_tries)
+
         # limit the length of the strings dump
-        result = resp.get("report", None)
+        result = json_data.get("report", None)
         if result:
-            result = json.loads(result)
+            result = orjson.loads(result)
             if "strings" in result and "dump" in result["strings"]:
                 result["strings"]["dump"] = result["strings"]["dump"][:100]
 
         # set final report
         report["report"] = result
+    except Retry:
+        raise
     except AnalyzerRunException as e:
         error_message = (
             f"job_id:{job_id} analyzer:{analyzer_name}"
             f" md5:{md5} filename:{filename} Analyzer Error: {e}"
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error: %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            f"job_id:{job_id} analyzer:{analyzer_name} md5:{md5} filename:{filename}."
-            f" Unexpected Error: {e}"
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s. Unexpected Error: %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -67,45 +125,22 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(f"ended analyzer:{analyzer_name} job_id:{job_id}")
+    log.info("ended")
 
     return report
 
 
-def _poll_for_result(job_id, hash, max_tries):
-    poll_distance = 5
-    got_result = False
-    for chance in range(max_tries):
-        time.sleep(poll_distance)
-        logger.info(
-            f"PEframe polling. Try n:{chance+1}, job_id:{job_id}. Starting the query"
-        )
-        try:
-            status_code, json_data = _query_for_result(hash)
-        except requests.RequestException as e:
-            raise AnalyzerRunException(e)
-        analysis_status = json_data.get("status", None)
-        if analysis_status in ["success", "reported_with_fails", "failed"]:
-            got_result = True
-            break
-        elif status_code == 404:
-            pass
-        else:
-            logger.info(
-                "PEframe polling."
-                f" Try n:{chance+1}, job_id:{job_id}, status:{analysis_status}"
-            )
-
-    if got_result:
-        return json_data
-    else:
-        raise AnalyzerRunException(
-            f"max peframe polls tried without getting any result. job_id:{job_id}"
-        )
+def _check_status_code(req):
+    handler = _STATUS_HANDLERS.get(req.status_code)
+    if handler:
+        raise handler(req)
+    # just in case error is something else
+    req.raise_for_status()
 
 
 def _query_for_result(key):
     headers = {"Accept": "application/json"}
-    resp = requests.get(f"http://peframe:4000/peframe?key={key}", headers=headers)
-    data = resp.json()
+    resp = _session.get(f"http://peframe:4000/peframe?key={key}", headers=headers)
+    # parsed straight from the raw bytes
+    data = orjson.loads(resp.content)
     return resp.status_code, data
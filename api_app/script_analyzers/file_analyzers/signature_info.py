@@ -1,4 +1,3 @@
-import traceback
 import logging
 
 from subprocess import Popen, DEVNULL, PIPE
@@ -12,7 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     p = None
     try:
@@ -51,15 +51,13 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except SoftTimeLimitExceeded as e:
-        error_message = (
-            f"job_id:{job_id} analyzer:{analyzer_name} md5:{md5} filename: {filename}."
-            f" Soft Time Limit Exceeded Error {e}"
+        log.error(
+            "md5:%s filename:%s Soft Time Limit Exceeded Error %s", md5, filename, e
         )
-        logger.error(error_message)
         report["errors"].append(str(e))
         report["success"] = False
         # we should stop the subprocesses...
@@ -67,12 +65,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
         if p:
             p.kill()
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -82,6 +75,6 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     # pprint.pprint(report)
 
-    logger.info("ended analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log.info("ended")
 
     return report
@@ -1,6 +1,5 @@
 import time
 import logging
-import traceback
 
 import requests
 from api_app.script_analyzers import general
@@ -15,7 +14,8 @@ vt_base = "https://www.virustotal.com/vtapi/v2/"
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info(f"started analyzer: {analyzer_name} job_id: {job_id}")
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "")
@@ -53,7 +53,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             got_result = False
             for chance in range(max_tries):
                 time.sleep(poll_distance)
-                logger.info(f"vt polling, try n.{chance + 1}. job_id {job_id}")
+                log.info("vt polling, try n.%s", chance + 1)
                 result = vt2_get.vt_get_report(api_key, scan_id, "hash")
                 response_code = result.get("response_code", 1)
                 # response code -2 means the we still have to wait
@@ -61,14 +61,10 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
                     continue
                 elif response_code == 1:
                     got_result = True
-                    logger.info(
-                        f"vt polling retrieved the result correctly for job_id {job_id}"
-                    )
+                    log.info("vt polling retrieved the result correctly")
                     break
             if not got_result:
-                logger.info(
-                    f"max VT polls tried without getting any result. job_id {job_id}"
-                )
+                log.info("max VT polls tried without getting any result")
 
         # pprint.pprint(result)
         report["report"] = result
@@ -77,16 +73,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -94,7 +85,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(f"ended analyzer: {analyzer_name} job_id: {job_id}")
+    log.info("ended")
 
     return report
 
@@ -1,6 +1,5 @@
 import logging
 import time
-import traceback
 
 import requests
 from api_app.script_analyzers import general
@@ -15,7 +14,8 @@ vt_base = "https://www.virustotal.com/api/v3/"
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info(f"started analyzer {analyzer_name} job_id {job_id}")
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "")
@@ -33,16 +33,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -52,7 +47,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(f"ended analyzer {analyzer_name} job_id {job_id}")
+    log.info("ended")
 
     return report
 
@@ -89,7 +84,7 @@ def vt_scan_file(api_key, md5, job_id, additional_config_params):
     for chance in range(max_tries):
         time.sleep(poll_distance)
         logger.info(
-            f"vt polling, try n.{chance + 1}. job_id {job_id}. starting the query"
+            "vt polling, try n.%s. job_id %s. starting the query", chance + 1, job_id
         )
         try:
             response = requests.get(vt_base + uri, headers=headers)
@@ -106,9 +101,10 @@ def vt_scan_file(api_key, md5, job_id, additional_config_params):
             break
         else:
             logger.info(
-                "vt polling, try n.{}. job_id {}. status:{}".format(
-                    chance + 1, job_id, analysis_status
-                )
+                "vt polling, try n.%s. job_id %s. status:%s",
+                chance + 1,
+                job_id,
+                analysis_status,
             )
 
     if not got_result:
@@ -1,6 +1,5 @@
 import os
 import logging
-import traceback
 import yara
 
 from git import Repo
@@ -13,7 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params):
-    logger.info("started analyzer {} job_id {}" "".format(analyzer_name, job_id))
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started")
     report = general.get_basic_report_template(analyzer_name)
     try:
         directories_with_rules = additional_config_params.get(
@@ -72,16 +72,11 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
             "job_id:{} analyzer:{} md5:{} filename: {} Analyzer Error {}"
             "".format(job_id, analyzer_name, md5, filename, e)
         )
-        logger.error(error_message)
+        log.error("md5:%s filename:%s Analyzer Error %s", md5, filename, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} md5:{} filename: {} Unexpected Error {}"
-            "".format(job_id, analyzer_name, md5, filename, e)
-        )
-        logger.exception(error_message)
+        log.exception("md5:%s filename:%s Unexpected Error %s", md5, filename, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -89,7 +84,7 @@ def run(analyzer_name, job_id, filepath, filename, md5, additional_config_params
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(f"ended analyzer: {analyzer_name} job_id: {job_id}")
+    log.info("ended")
 
     # pprint.pprint(report)
 
@@ -117,8 +112,8 @@ def yara_update_repos():
                     repo = Repo(yara_dir)
                     o = repo.remotes.origin
                     o.pull()
-                    logger.info("pull repo on {} dir".format(yara_dir))
+                    logger.info("pull repo on %s dir", yara_dir)
                 else:
-                    logger.warning("yara dir {} does not exist".format(yara_dir))
+                    logger.warning("yara dir %s does not exist", yara_dir)
 
     return found_yara_dirs
@@ -7,20 +7,42 @@ from api_app.exceptions import (
     AnalyzerRunException,
     AlreadyFailedJobException,
 )
-from api_app.models import Job
+from api_app.models import AnalysisReport, Job
 from api_app.utilities import get_now
-from intel_owl import tasks, settings
+from intel_owl import tasks
 
-from django.utils import timezone
 from django.db import transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Cast
 
 logger = logging.getLogger(__name__)
 
 
+class AnalyzerLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter for a single analyzer run:
+    prefixes the messages with the job and the analyzer
+    and adds them to the log records as the "job_id" and "analyzer" attributes
+    """
+
+    def __init__(self, logger, job_id, analyzer_name):
+        super().__init__(logger, {"job_id": job_id, "analyzer": analyzer_name})
+
+    def process(self, msg, kwargs):
+        # called only if the record is going to be emitted
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        prefix = f"job_id:{self.extra['job_id']} analyzer:{self.extra['analyzer']}"
+        return f"{prefix} {msg}", kwargs
+
+
 def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_sample):
     set_job_status(job_id, "running")
     if is_sample:
-        file_path, filename = get_filepath_filename(job_id)
+        # the job is read once and shared by all the analyzers to start
+        job_object = object_by_job_id(job_id, fields=["file_name", "file"])
+        file_path, filename = get_filepath_filename(job_id, job_object)
+        sha256 = None
     else:
         observable_name, observable_classification = get_observable_data(job_id)
 
@@ -37,7 +59,8 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
                 "additional_config_params", {}
             )
 
-            # run analyzer with a celery task asynchronously
+            # run analyzer with a celery task asynchronously.
+            # The queue is the one declared by the task, the default one otherwise
             if is_sample:
                 # check if we should run the hash instead of the binary
                 run_hash = analyzers_config[analyzer].get("run_hash", "")
@@ -49,7 +72,10 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
                     if run_hash_type == "md5":
                         hash_value = md5
                     elif run_hash_type == "sha256":
-                        hash_value = generate_sha256(job_id)
+                        # the binary is read and hashed at most once per job
+                        if sha256 is None:
+                            sha256 = generate_sha256(job_id, job_object)
+                        hash_value = sha256
                     else:
                         error_message = (
                             f"only md5 and sha256 are supported "
@@ -64,9 +90,7 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
                         "hash",
                         additional_config_params,
                     ]
-                    getattr(tasks, analyzer_module).apply_async(
-                        args=args, queue=settings.CELERY_TASK_DEFAULT_QUEUE
-                    )
+                    getattr(tasks, analyzer_module).apply_async(args=args)
                 else:
                     # run the analyzer with the binary
                     args = [
@@ -77,9 +101,7 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
                         md5,
                         additional_config_params,
                     ]
-                    getattr(tasks, analyzer_module).apply_async(
-                        args=args, queue=settings.CELERY_TASK_DEFAULT_QUEUE
-                    )
+                    getattr(tasks, analyzer_module).apply_async(args=args)
             else:
                 # observables analyzer case
                 args = [
@@ -89,9 +111,7 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
                     observable_classification,
                     additional_config_params,
                 ]
-                getattr(tasks, analyzer_module).apply_async(
-                    args=args, queue=settings.CELERY_TASK_DEFAULT_QUEUE
-                )
+                getattr(tasks, analyzer_module).apply_async(args=args)
 
         except (AnalyzerConfigurationException, AnalyzerRunException) as e:
             error_message = "job_id {}. analyzer: {}. error: {}".format(
@@ -101,12 +121,13 @@ def start_analyzers(analyzers_to_execute, analyzers_config, job_id, md5, is_samp
             set_failed_analyzer(analyzer, job_id, error_message)
 
 
-def object_by_job_id(job_id, transaction=False):
+def object_by_job_id(job_id, fields=None):
+    queryset = Job.objects.all()
+    if fields:
+        # fetch only the columns the caller needs
+        queryset = queryset.only(*fields)
     try:
-        if transaction:
-            job_object = Job.objects.select_for_update().get(id=job_id)
-        else:
-            job_object = Job.objects.get(id=job_id)
+        job_object = queryset.get(id=job_id)
     except Job.DoesNotExist:
         raise AnalyzerRunException(f"no job_id {job_id} retrieved")
 
@@ -115,24 +136,25 @@ def object_by_job_id(job_id, transaction=False):
 
 def get_binary(job_id, job_object=None):
     if not job_object:
-        job_object = object_by_job_id(job_id)
-    logger.info(f"getting binary for job_id {job_id}")
+        job_object = object_by_job_id(job_id, fields=["file"])
+    logger.info("getting binary for job_id %s", job_id)
     job_file = job_object.file
-    logger.info(f"got job_file {job_file} for job_id {job_id}")
+    logger.info("got job_file %s for job_id %s", job_file, job_id)
 
     binary = job_file.read()
     return binary
 
 
-def generate_sha256(job_id):
-    binary = get_binary(job_id)
+def generate_sha256(job_id, job_object=None):
+    binary = get_binary(job_id, job_object)
     return hashlib.sha256(binary).hexdigest()
 
 
-def get_filepath_filename(job_id):
+def get_filepath_filename(job_id, job_object=None):
     # this function allows to minimize access to the database
     # in this way the analyzers could not touch the DB until the end of the analysis
-    job_object = object_by_job_id(job_id)
+    if not job_object:
+        job_object = object_by_job_id(job_id, fields=["file_name", "file"])
 
     filename = job_object.file_name
 
@@ -142,7 +164,9 @@ def get_filepath_filename(job_id):
 
 
 def get_observable_data(job_id):
-    job_object = object_by_job_id(job_id)
+    job_object = object_by_job_id(
+        job_id, fields=["observable_name", "observable_classification"]
+    )
 
     observable_name = job_object.observable_name
     observable_classification = job_object.observable_classification
@@ -151,92 +175,120 @@ def get_observable_data(job_id):
 
 
 def get_basic_report_template(analyzer_name):
+    # read the clock once and format it in UTC, as timezone.now() would
+    started_time = time.time()
     return {
         "name": analyzer_name,
         "success": False,
         "report": {},
         "errors": [],
         "process_time": 0,
-        "started_time": time.time(),
-        "started_time_str": timezone.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "started_time": started_time,
+        "started_time_str": time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.gmtime(started_time)
+        ),
+        # used to measure the process time, it is not saved in the report
+        "started_monotonic": time.monotonic(),
     }
 
 
 def set_report_and_cleanup(job_id, report):
-    analyzer_name = report.get("name", "")
-    logger.info(
-        f"start set_report_and_cleanup for job_id:{job_id},"
-        f" analyzer:{analyzer_name}"
-    )
-    job_object = None
+    log = AnalyzerLoggerAdapter(logger, job_id, report.get("name", ""))
+    log.info("start set_report_and_cleanup")
 
     try:
-        # add process time
-        finished_time = time.time()
-        report["process_time"] = finished_time - report["started_time"]
+        # add process time. The monotonic clock does not jump with system clock
+        # changes, but it is meaningful only in the process that started it
+        started_monotonic = report.pop("started_monotonic", None)
+        if started_monotonic is not None:
+            report["process_time"] = time.monotonic() - started_monotonic
+        else:
+            report["process_time"] = time.time() - report["started_time"]
 
         with transaction.atomic():
-            job_object = object_by_job_id(job_id, transaction=True)
-            job_object.analysis_reports.append(report)
-            job_object.save(update_fields=["analysis_reports"])
+            # the job row is locked only while the report is inserted and counted,
+            # so that exactly one report can be the last one
+            try:
+                job_object = (
+                    Job.objects.select_for_update()
+                    .only("status", "analyzers_to_execute")
+                    .get(pk=job_id)
+                )
+            except Job.DoesNotExist:
+                raise AnalyzerRunException(f"no job_id {job_id} retrieved")
             if job_object.status == "failed":
                 raise AlreadyFailedJobException()
 
-        num_analysis_reports = len(job_object.analysis_reports)
-        num_analyzers_to_execute = len(job_object.analyzers_to_execute)
-        logger.info(
-            f"job_id:{job_id}, analyzer {analyzer_name}, "
-            f"num analysis reports:{num_analysis_reports}, "
-            f"num analyzer to execute:{num_analyzers_to_execute}"
-        )
+            # a single INSERT of the new report, the previous ones are not touched
+            AnalysisReport.objects.create(
+                job_id=job_id, payload=report, success=report.get("success", False)
+            )
+            counts = AnalysisReport.objects.filter(job_id=job_id).aggregate(
+                num_analysis_reports=Count("pk"),
+                failed_analyzers=Count("pk", filter=Q(success=False)),
+            )
+            num_analysis_reports = counts["num_analysis_reports"]
+            failed_analyzers = counts["failed_analyzers"]
+            num_analyzers_to_execute = len(job_object.analyzers_to_execute)
+            log.info(
+                "num analysis reports:%s, num analyzer to execute:%s",
+                num_analysis_reports,
+                num_analyzers_to_execute,
+            )
 
-        # check if it was the last analysis...
-        # ..In case, set the analysis as "reported" or "failed"
-        if num_analysis_reports == num_analyzers_to_execute:
-            status_to_set = "reported_without_fails"
-            # set status "failed" in case all analyzers failed
-            failed_analyzers = 0
-            for analysis_report in job_object.analysis_reports:
-                if not analysis_report.get("success", False):
-                    failed_analyzers += 1
-            if failed_analyzers == num_analysis_reports:
-                status_to_set = "failed"
-            elif failed_analyzers >= 1:
-                status_to_set = "reported_with_fails"
-            set_job_status(job_id, status_to_set)
-            job_object.finished_analysis_time = get_now()
-            job_object.save(update_fields=["finished_analysis_time"])
+            # check if it was the last analysis...
+            # ..In case, set the analysis as "reported" or "failed"
+            if num_analysis_reports == num_analyzers_to_execute:
+                status_to_set = "reported_without_fails"
+                # set status "failed" in case all analyzers failed
+                if failed_analyzers == num_analysis_reports:
+                    status_to_set = "failed"
+                elif failed_analyzers >= 1:
+                    status_to_set = "reported_with_fails"
+                set_job_status(
+                    job_id,
+                    status_to_set,
+                    extra_fields={"finished_analysis_time": get_now()},
+                )
 
     except AlreadyFailedJobException:
-        logger.error(
-            f"job_id {job_id} status failed. Do not process the report {report}"
-        )
+        # the report is formatted only if the record is actually emitted
+        log.error("job status failed. Do not process the report %s", report)
 
     except Exception as e:
-        logger.exception(f"job_id: {job_id}, Error: {e}")
-        set_job_status(job_id, "failed", errors=[str(e)])
-        job_object.finished_analysis_time = get_now()
-        job_object.save(update_fields=["finished_analysis_time"])
+        log.exception("Error: %s", e)
+        set_job_status(
+            job_id,
+            "failed",
+            errors=[str(e)],
+            extra_fields={"finished_analysis_time": get_now()},
+        )
 
 
-def set_job_status(job_id, status, errors=None):
-    message = f"setting job_id {job_id} to status {status}"
-    if status == "failed":
-        logger.error(message)
-    else:
-        logger.info(message)
-    job_object = object_by_job_id(job_id)
+def set_job_status(job_id, status, errors=None, extra_fields=None):
+    log_level = logging.ERROR if status == "failed" else logging.INFO
+    logger.log(log_level, "setting job_id %s to status %s", job_id, status)
+    # other fields to set in the same UPDATE, like finished_analysis_time
+    fields_to_update = dict(extra_fields or {})
+    fields_to_update["status"] = status
     if errors:
-        job_object.errors.extend(errors)
-    job_object.status = status
-    job_object.save()
+        # append server-side instead of reading and rewriting the whole array.
+        # psycopg2 sends lists as text[]: cast them to the type of the column
+        errors_field = Job._meta.get_field("errors")
+        fields_to_update["errors"] = CombinedExpression(
+            F("errors"),
+            "||",
+            Cast(Value(errors), output_field=errors_field),
+            output_field=errors_field,
+        )
+    updated = Job.objects.filter(pk=job_id).update(**fields_to_update)
+    if not updated:
+        raise AnalyzerRunException(f"no job_id {job_id} retrieved")
 
 
 def set_failed_analyzer(analyzer_name, job_id, error_message):
-    logger.info(
-        f"setting analyzer {analyzer_name} of job_id {job_id} as failed."
-        f" Error message:{error_message}"
-    )
+    log = AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("setting analyzer as failed. Error message:%s", error_message)
     report = get_basic_report_template(analyzer_name)
     report["errors"].append(error_message)
     set_report_and_cleanup(job_id, report)
@@ -1,7 +1,6 @@
 """Module to retrieve active DNS resolution
 """
 
-import traceback
 import requests
 import ipaddress
 import socket
@@ -46,9 +45,8 @@ def run(
     :return: report: dict
         name: observable_name, resolution: ip,NXDOMAIN, ''
     """
-    logger.info(
-        f"started analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
 
     try:
@@ -95,16 +93,11 @@ def run(
             f"job_id:{job_id} analyzer:{analyzer_name} "
             f"observable_name:{observable_name} Analyzer error {e}"
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            f"job_id:{job_id} analyzer:{analyzer_name} "
-            f"observable_name:{observable_name} Unexpected error {e}"
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -112,9 +105,7 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        f"ended analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
 
@@ -145,8 +136,10 @@ def _doh_google(
                     authority_answer = authority[0].get("data", "")
                 else:
                     logger.error(
-                        f"observable: {observable_name} active_dns query"
-                        f" retrieved no valid A answer: {answers}"
+                        "observable: %s active_dns query"
+                        " retrieved no valid A answer: %s",
+                        observable_name,
+                        answers,
                     )
             report["report"] = {
                 "name": observable_name,
@@ -247,8 +240,10 @@ def _doh_cloudflare_malware(
                     result["is_malicious"] = True
             else:
                 logger.warning(
-                    f"no Answer key retrieved for {observable_name} DNS request coming"
-                    f" from {analyzer_name} analyzer"
+                    "no Answer key retrieved for %s DNS request coming"
+                    " from %s analyzer",
+                    observable_name,
+                    analyzer_name,
                 )
                 result["no_answer"] = True
 
@@ -285,7 +280,7 @@ def _classic_dns(
             domains = socket.gethostbyaddr(observable_name)
             resolutions = domains[2]
         except (socket.gaierror, socket.herror):
-            logger.info(f"no resolution found for observable {observable_name}")
+            logger.info("no resolution found for observable %s", observable_name)
         result = {"name": observable_name, "resolutions": resolutions}
     elif observable_classification == "domain":
         try:
@@ -1,4 +1,3 @@
-import traceback
 import logging
 
 import requests
@@ -17,10 +16,8 @@ def run(
     observable_classification,
     additional_config_params,
 ):
-    logger.info(
-        "started analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "")
@@ -43,16 +40,11 @@ def run(
             "job_id:{} analyzer:{} observable_name:{} Analyzer error {}"
             "".format(job_id, analyzer_name, observable_name, e)
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} observable_name:{} Unexpected error {}"
-            "".format(job_id, analyzer_name, observable_name, e)
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -60,9 +52,6 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        "ended analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
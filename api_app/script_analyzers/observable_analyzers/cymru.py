@@ -1,5 +1,4 @@
 import socket
-import traceback
 import logging
 
 from api_app.exceptions import AnalyzerRunException
@@ -15,9 +14,8 @@ def run(
     observable_classification,
     additional_config_params,
 ):
-    logger.info(
-        f"started analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
     try:
         results = {}
@@ -36,7 +34,7 @@ def run(
             domains = socket.gethostbyaddr(query_to_perform)
             resolutions = domains[2]
         except (socket.gaierror, socket.herror):
-            logger.info(f"observable {observable_name} not found in HMR DB")
+            log.info("observable %s not found in HMR DB", observable_name)
         if resolutions:
             results["found"] = True
         results["resolution_data"] = resolutions
@@ -47,16 +45,11 @@ def run(
             f"job_id:{job_id} analyzer:{analyzer_name}"
             f" observable_name:{observable_name} Analyzer error {e}"
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            f"job_id:{job_id} analyzer:{analyzer_name}"
-            f" observable_name:{observable_name} Unexpected error {e}"
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -64,8 +57,6 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        f"ended analyzer {analyzer_name} job_id {job_id} observable {observable_name}"
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
@@ -2,7 +2,6 @@ import datetime
 import os
 import logging
 import tarfile
-import traceback
 
 import maxminddb
 import requests
@@ -24,10 +23,8 @@ def run(
     observable_classification,
     additional_config_params,
 ):
-    logger.info(
-        "started analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
     try:
         try:
@@ -38,7 +35,7 @@ def run(
             reader.close()
         except maxminddb.InvalidDatabaseError as e:
             error_message = "invalid database error: {}".format(e)
-            logger.exception(error_message)
+            log.exception("invalid database error: %s", e)
             maxmind_result = {"error": error_message}
 
         if not maxmind_result:
@@ -50,16 +47,11 @@ def run(
             "job_id:{} analyzer:{} observable_name:{} Analyzer error {}"
             "".format(job_id, analyzer_name, observable_name, e)
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} observable_name:{} Unexpected error {}"
-            "".format(job_id, analyzer_name, observable_name, e)
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -67,10 +59,7 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        "finished analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
 
@@ -117,15 +106,13 @@ def updater(additional_config_params):
             try:
                 os.rename(downloaded_db_path, database_location)
             except FileNotFoundError:
-                logger.debug(
-                    "{} not found move to the day before".format(downloaded_db_path)
-                )
+                logger.debug("%s not found move to the day before", downloaded_db_path)
                 counter += 1
             else:
                 directory_found = True
 
         if directory_found:
-            logger.info("maxmind directory found {}".format(downloaded_db_path))
+            logger.info("maxmind directory found %s", downloaded_db_path)
         else:
             raise AnalyzerRunException(
                 "failed extraction of maxmind db, reached max number of attempts"
@@ -134,7 +121,6 @@ def updater(additional_config_params):
         logger.info("ended download of db from maxmind")
 
     except Exception as e:
-        traceback.print_exc()
         logger.exception(str(e))
 
     return database_location
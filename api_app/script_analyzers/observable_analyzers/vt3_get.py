@@ -1,6 +1,5 @@
 import base64
 import time
-import traceback
 import requests
 import logging
 
@@ -22,10 +21,8 @@ def run(
     observable_classification,
     additional_config_params,
 ):
-    logger.info(
-        "started analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log = general.AnalyzerLoggerAdapter(logger, job_id, analyzer_name)
+    log.info("started observable_name:%s", observable_name)
     report = general.get_basic_report_template(analyzer_name)
     try:
         api_key_name = additional_config_params.get("api_key_name", "")
@@ -49,16 +46,11 @@ def run(
             "job_id:{} analyzer:{} observable_name:{} Analyzer error {}"
             "".format(job_id, analyzer_name, observable_name, e)
         )
-        logger.error(error_message)
+        log.error("observable_name:%s Analyzer error %s", observable_name, e)
         report["errors"].append(error_message)
         report["success"] = False
     except Exception as e:
-        traceback.print_exc()
-        error_message = (
-            "job_id:{} analyzer:{} observable_name:{} Unexpected error {}"
-            "".format(job_id, analyzer_name, observable_name, e)
-        )
-        logger.exception(error_message)
+        log.exception("observable_name:%s Unexpected error %s", observable_name, e)
         report["errors"].append(str(e))
         report["success"] = False
     else:
@@ -68,10 +60,7 @@ def run(
 
     general.set_report_and_cleanup(job_id, report)
 
-    logger.info(
-        "ended analyzer {} job_id {} observable {}"
-        "".format(analyzer_name, job_id, observable_name)
-    )
+    log.info("ended observable_name:%s", observable_name)
 
     return report
 
@@ -153,8 +142,10 @@ def vt_get_report(
     for chance in range(max_tries):
         try:
             logger.info(
-                "trying VT/v3 GET n.{} for job_id {}, observable {}"
-                "".format(chance + 1, job_id, observable_name)
+                "trying VT/v3 GET n.%s for job_id %s, observable %s",
+                chance + 1,
+                job_id,
+                observable_name,
             )
             response = requests.get(vt_base + uri, params=params, headers=headers)
             # this case is not a real error,...
@@ -172,12 +163,12 @@ def vt_get_report(
             # you need the binary too for this case, ..
             # .. otherwise it would fail if it's not available
             if response.status_code == 404:
-                logger.info(f"hash {observable_name} not found on VT")
+                logger.info("hash %s not found on VT", observable_name)
                 force_active_file_scan = additional_config_params.get(
                     "force_active_scan", False
                 )
                 if force_active_file_scan:
-                    logger.info(f"forcing VT active scan for hash {observable_name}")
+                    logger.info("forcing VT active scan for hash %s", observable_name)
                     result = vt3_scan.vt_scan_file(
                         api_key, observable_name, job_id, additional_config_params
                     )
@@ -193,15 +184,22 @@ def vt_get_report(
                     .get("last_analysis_results", {})
                 )
                 if last_analysis_results:
-                    logger.info(f"hash {observable_name} found on VT with AV reports")
+                    logger.info("hash %s found on VT with AV reports", observable_name)
                     break
                 else:
                     extra_polling_times = chance + 1
-                    base_log = f"hash {observable_name} found on VT withOUT AV reports,"
+                    base_log = "hash %s found on VT withOUT AV reports,"
                     if extra_polling_times == max_tries:
-                        logger.info(f"{base_log} reached max tries: {max_tries}")
+                        logger.info(
+                            base_log + " reached max tries: %s",
+                            observable_name,
+                            max_tries,
+                        )
                     else:
-                        logger.info(f"{base_log} performing another request...")
+                        logger.info(
+                            base_log + " performing another request...",
+                            observable_name,
+                        )
                         result["extra_polling_times"] = extra_polling_times
                         time.sleep(poll_distance)
         else:
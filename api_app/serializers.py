@@ -23,6 +23,7 @@ class JobSerializer(serializers.ModelSerializer):
     tags_id = serializers.PrimaryKeyRelatedField(
         many=True, write_only=True, queryset=Tag.objects.all()
     )
+    analysis_reports = serializers.JSONField(read_only=True)
 
     class Meta:
         model = Job
@@ -48,7 +49,7 @@ class JobListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Job
-        exclude = ("analysis_reports", "errors")
+        exclude = ("errors",)
 
 
 class TokenRefreshPatchedSerializer(serializers.Serializer):
@@ -139,6 +139,8 @@ CELERY_WORKER_HIJACK_ROOT_LOGGER = False
 CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_DEFAULT_QUEUE = "analyzers_queue"
+# tasks which only wait for docker based analyzers are consumed by their own workers
+CELERY_DOCKER_ANALYZERS_QUEUE = "docker_analyzers_queue"
 
 AWS_SQS = True if os.environ.get("AWS_SQS", False) == "True" else False
 if AWS_SQS:
@@ -49,6 +49,7 @@ from api_app.script_analyzers.observable_analyzers import (
 )
 
 from api_app import crons
+from intel_owl import settings
 
 
 @shared_task(soft_time_limit=500)
@@ -702,10 +703,17 @@ def tranco_run(
     )
 
 
-@shared_task(soft_time_limit=500)
+@shared_task(soft_time_limit=500, queue=settings.CELERY_DOCKER_ANALYZERS_QUEUE)
 def peframe_run(
     analyzer_name, job_id, filepath, filename, md5, additional_config_params
 ):
     peframe.run(
         analyzer_name, job_id, filepath, filename, md5, additional_config_params
     )
+
+
+@shared_task(
+    bind=True, soft_time_limit=60, queue=settings.CELERY_DOCKER_ANALYZERS_QUEUE
+)
+def peframe_poll(self, analyzer_name, job_id, filename, md5, key, report, max_tries):
+    peframe.poll(self, analyzer_name, job_id, filename, md5, key, report, max_tries)
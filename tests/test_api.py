@@ -17,11 +17,11 @@ if settings.DISABLE_LOGGING_TEST:
 
 # class for mocking responses
 class MockResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, content=b""):
         self.json_data = json_data
         self.status_code = status_code
         self.text = ""
-        self.content = b""
+        self.content = content
 
     def json(self):
         return self.json_data
@@ -1,6 +1,9 @@
 import hashlib
+import json
 import logging
+import time
 
+from celery.exceptions import Retry
 from django.core.files import File
 from django.test import TestCase
 from unittest.mock import patch, MagicMock
@@ -26,7 +29,7 @@ from api_app.models import Job
 from api_app.script_analyzers.file_analyzers import signature_info
 from .test_api import MockResponse
 
-from intel_owl import settings
+from intel_owl import settings, tasks
 
 logger = logging.getLogger(__name__)
 # disable logging library for travis
@@ -60,13 +63,36 @@ def mocked_cuckoo_get(*args, **kwargs):
 
 
 def mocked_peframe_get(*args, **kwargs):
-    return MockResponse({"key": "test", "status": "success", "report": {}}, 200,)
+    json_data = {"key": "test", "status": "success", "report": {}}
+    return MockResponse(json_data, 200, content=json.dumps(json_data).encode())
 
 
 def mocked_peframe_post(*args, **kwargs):
     return MockResponse({"key": "test", "status": "running"}, 202)
 
 
+def mocked_peframe_get_running(*args, **kwargs):
+    json_data = {"key": "test", "status": "running"}
+    return MockResponse(json_data, 200, content=json.dumps(json_data).encode())
+
+
+def mocked_peframe_poll(args=None, countdown=0, **kwargs):
+    # execute the polling task locally instead of sending it to the broker.
+    # An eager retry would run again at once, ignoring the countdown:
+    # every retry is run here after the countdown, as a worker would do
+    with patch.object(tasks.peframe_poll, "retry", return_value=Retry()):
+        retries = 0
+        while True:
+            # the mocked container answers at once
+            if not settings.MOCK_CONNECTIONS:
+                time.sleep(countdown)
+            result = tasks.peframe_poll.apply(args=args, retries=retries)
+            if result.state != "RETRY":
+                return result
+            retries += 1
+            countdown = peframe.POLL_DISTANCE
+
+
 class FileAnalyzersEXETests(TestCase):
     def setUp(self):
         params = {
@@ -212,9 +238,10 @@ class FileAnalyzersEXETests(TestCase):
         )
         self.assertEqual(report.get("success", False), True)
 
-    @mock_connections(patch("requests.get", side_effect=mocked_peframe_get))
-    @mock_connections(patch("requests.post", side_effect=mocked_peframe_post))
-    def test_peframe_scan_file(self, mock_get=None, mock_post=None):
+    @mock_connections(patch("requests.Session.get", side_effect=mocked_peframe_get))
+    @mock_connections(patch("requests.Session.post", side_effect=mocked_peframe_post))
+    @patch("intel_owl.tasks.peframe_poll.apply_async", side_effect=mocked_peframe_poll)
+    def test_peframe_scan_file(self, mock_poll, mock_get=None, mock_post=None):
         additional_params = {"max_tries": 10}
         report = peframe.run(
             "PEframe_Scan_File",
@@ -224,7 +251,51 @@ class FileAnalyzersEXETests(TestCase):
             self.md5,
             additional_params,
         )
-        self.assertEqual(report.get("success", False), True)
+        # the report is set by the polling task
+        self.assertIsNone(report)
+        mock_poll.assert_called_once()
+        job = Job.objects.get(pk=self.job_id)
+        self.assertEqual(job.analysis_reports[-1].get("errors", []), [])
+        self.assertEqual(job.analysis_reports[-1].get("success", False), True)
+
+    def _poll_peframe(self, task, max_tries):
+        report = general.get_basic_report_template("PEframe_Scan_File")
+        report.pop("started_monotonic")
+        peframe.poll(
+            task,
+            "PEframe_Scan_File",
+            self.job_id,
+            self.filename,
+            self.md5,
+            "test",
+            report,
+            max_tries,
+        )
+
+    @patch("requests.Session.get", side_effect=mocked_peframe_get_running)
+    def test_peframe_poll_not_ready(self, mock_get):
+        task = MagicMock()
+        task.request.retries = 0
+        task.retry.return_value = Retry()
+        with self.assertRaises(Retry):
+            self._poll_peframe(task, max_tries=3)
+        task.retry.assert_called_once_with(
+            countdown=peframe.POLL_DISTANCE, max_retries=3
+        )
+        job = Job.objects.get(pk=self.job_id)
+        self.assertEqual(job.analysis_reports, [])
+
+    @patch("requests.Session.get", side_effect=mocked_peframe_get_running)
+    def test_peframe_poll_max_tries(self, mock_get):
+        task = MagicMock()
+        # last allowed try
+        task.request.retries = 2
+        self._poll_peframe(task, max_tries=3)
+        task.retry.assert_not_called()
+        job = Job.objects.get(pk=self.job_id)
+        report = job.analysis_reports[-1]
+        self.assertEqual(report.get("success", True), False)
+        self.assertIn("max peframe polls", report["errors"][0])
 
 
 class FileAnalyzersDLLTests(TestCase):
@@ -276,9 +347,10 @@ class FileAnalyzersDocTests(TestCase):
         )
         self.assertEqual(report.get("success", False), True)
 
-    @mock_connections(patch("requests.get", side_effect=mocked_peframe_get))
-    @mock_connections(patch("requests.post", side_effect=mocked_peframe_post))
-    def test_peframe_scan_file(self, mock_get=None, mock_post=None):
+    @mock_connections(patch("requests.Session.get", side_effect=mocked_peframe_get))
+    @mock_connections(patch("requests.Session.post", side_effect=mocked_peframe_post))
+    @patch("intel_owl.tasks.peframe_poll.apply_async", side_effect=mocked_peframe_poll)
+    def test_peframe_scan_file(self, mock_poll, mock_get=None, mock_post=None):
         additional_params = {"max_tries": 1}
         report = peframe.run(
             "PEframe_Scan_File",
@@ -288,7 +360,12 @@ class FileAnalyzersDocTests(TestCase):
             self.md5,
             additional_params,
         )
-        self.assertEqual(report.get("success", False), True)
+        # the report is set by the polling task
+        self.assertIsNone(report)
+        mock_poll.assert_called_once()
+        job = Job.objects.get(pk=self.job_id)
+        self.assertEqual(job.analysis_reports[-1].get("errors", []), [])
+        self.assertEqual(job.analysis_reports[-1].get("success", False), True)
 
 
 class FileAnalyzersRtfTests(TestCase):
@@ -1,3 +1,4 @@
+import datetime
 import logging
 import os
 
@@ -8,7 +9,9 @@ from api_app.script_analyzers.file_analyzers import yara_scan
 from api_app.script_analyzers.observable_analyzers import maxmind, talos, tor
 
 from api_app import crons
-from api_app.utilities import get_analyzer_config
+from api_app.models import Job
+from api_app.script_analyzers import general
+from api_app.utilities import get_analyzer_config, get_now
 from intel_owl import settings
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,26 @@ class CronTests(TestCase):
         logger.info(f"jobs_id_stuck: {jobs_id_stuck}")
         self.assertTrue(True)
 
+    def test_check_stuck_analysis_sets_failed(self):
+        job = Job.objects.create(
+            source="test",
+            md5="test",
+            observable_name="8.8.8.8",
+            observable_classification="ip",
+            status="running",
+        )
+        # auto_now_add ignores the value passed on creation
+        Job.objects.filter(pk=job.id).update(
+            received_request_time=get_now() - datetime.timedelta(minutes=30)
+        )
+        # a single SELECT of the running jobs and a single UPDATE of the stuck one
+        with self.assertNumQueries(2):
+            jobs_id_stuck = crons.check_stuck_analysis()
+        self.assertEqual(jobs_id_stuck, [job.id])
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertIsNotNone(job.finished_analysis_time)
+
     def test_remove_old_jobs(self):
         num_jobs_to_delete = crons.remove_old_jobs()
         logger.info(f"old jobs deleted: {num_jobs_to_delete}")
@@ -51,3 +74,69 @@ class ConfigTests(TestCase):
     def test_config(self):
         config = get_analyzer_config()
         self.assertNotEqual(config, {})
+
+
+class JobStatusTests(TestCase):
+    def setUp(self):
+        self.job = Job.objects.create(
+            source="test",
+            md5="test",
+            observable_name="8.8.8.8",
+            observable_classification="ip",
+            status="running",
+            errors=["previous error"],
+        )
+
+    def test_set_job_status_appends_errors(self):
+        general.set_job_status(self.job.id, "failed", errors=["new error"])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "failed")
+        self.assertEqual(self.job.errors, ["previous error", "new error"])
+
+
+class SetReportTests(TestCase):
+    def setUp(self):
+        self.job = Job.objects.create(
+            source="test",
+            md5="test",
+            observable_name="8.8.8.8",
+            observable_classification="ip",
+            status="running",
+            analyzers_to_execute=["first", "second"],
+        )
+
+    def _send_report(self, analyzer_name, success):
+        report = general.get_basic_report_template(analyzer_name)
+        report["success"] = success
+        general.set_report_and_cleanup(self.job.id, report)
+        self.job.refresh_from_db()
+
+    def test_last_report_all_successes(self):
+        self._send_report("first", True)
+        self.assertEqual(self.job.status, "running")
+        self.assertIsNone(self.job.finished_analysis_time)
+        self._send_report("second", True)
+        self.assertEqual(self.job.status, "reported_without_fails")
+        self.assertIsNotNone(self.job.finished_analysis_time)
+        self.assertEqual(
+            [report["name"] for report in self.job.analysis_reports],
+            ["first", "second"],
+        )
+
+    def test_last_report_mixed_results(self):
+        self._send_report("first", True)
+        self._send_report("second", False)
+        self.assertEqual(self.job.status, "reported_with_fails")
+        self.assertIsNotNone(self.job.finished_analysis_time)
+
+    def test_last_report_all_failed(self):
+        self._send_report("first", False)
+        self._send_report("second", False)
+        self.assertEqual(self.job.status, "failed")
+        self.assertIsNotNone(self.job.finished_analysis_time)
+
+    def test_report_for_failed_job_is_dropped(self):
+        Job.objects.filter(pk=self.job.id).update(status="failed")
+        self._send_report("first", True)
+        self.assertEqual(self.job.status, "failed")
+        self.assertEqual(self.job.analysis_reports, [])